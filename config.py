@@ -12,6 +12,7 @@ FETCH_INTERVAL = config.getint('General', 'FETCH_INTERVAL', fallback=10)
 MIL_PREFIX_LIST = [prefix.strip() for prefix in config.get('General', 'MIL_PREFIX_LIST', fallback='7CF').split(',')]
 TAR1090_URL = config.get('General', 'TAR1090_URL', fallback='http://localhost/data/aircraft.json')
 BLINK_MILITARY = config.getboolean('General', 'BLINK_MILITARY', fallback=True)
+USE_HAVERSINE = config.getboolean('General', 'USE_HAVERSINE', fallback=False)
 
 # Audio Settings
 ATC_STREAM_URL = config.get('Audio', 'ATC_STREAM_URL', fallback='')
@@ -27,6 +28,7 @@ RADIUS_NM = config.getint('Location', 'RADIUS_NM', fallback=60)
 SCREEN_WIDTH = config.getint('Display', 'SCREEN_WIDTH', fallback=960)
 SCREEN_HEIGHT = config.getint('Display', 'SCREEN_HEIGHT', fallback=640)
 FPS = config.getint('Display', 'FPS', fallback=6)
+USE_SCALED = config.getboolean('Display', 'USE_SCALED', fallback=True)
 MAX_TABLE_ROWS = config.getint('Display', 'MAX_TABLE_ROWS', fallback=10)
 FONT_PATH = config.get('Display', 'FONT_PATH', fallback='fonts/TerminusTTF-4.49.3.ttf')
 BACKGROUND_PATH = config.get('Display', 'BACKGROUND_PATH', fallback=None)
@@ -1,44 +1,59 @@
 import requests
 import threading
 import time
-from typing import List
+from typing import Tuple
 
 import config
 from data_models import Aircraft
 
+# orjson is optional and parses large tar1090 payloads considerably faster than the standard library
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Keep the connection to tar1090 alive between polls rather than reconnecting every fetch
+_SESSION = requests.Session()
+_SESSION.mount('http://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 class AircraftTracker:
     """Handles fetching aircraft data from tar1090"""
     def __init__(self):
-        self.aircraft: List[Aircraft] = []
+        # Published as an immutable snapshot; generation advances only after a new snapshot is in place
+        self.aircraft: Tuple[Aircraft, ...] = ()
+        self.generation = 0
         self.status = "INITIALISING"
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.running = True
 
-    def fetch_data(self) -> List[Aircraft]:
+    def fetch_data(self) -> Tuple[Aircraft, ...]:
         """Fetch aircraft from local tar1090"""
         try:
             print(f"Fetching aircraft data from {config.TAR1090_URL}...")
-            response = requests.get(config.TAR1090_URL, timeout=10)
+            response = _SESSION.get(config.TAR1090_URL, timeout=10)
             response.raise_for_status()
-            data = response.json()
-            aircraft_list = []
-            for ac_data in data.get('aircraft', []):
-                ac = Aircraft.from_dict(ac_data)
-                if ac:
-                    aircraft_list.append(ac)
+            data = _loads(response.content)
+            from_dict = Aircraft.from_dict
+            aircraft_list = tuple(ac for ac in map(from_dict, data.get('aircraft', [])) if ac)
             print(f"Found {len(aircraft_list)} aircraft within {config.RADIUS_NM}NM range")
             return aircraft_list
         except requests.RequestException as e:
             print(f"Error: Couldn't fetch aircraft data: {e}")
-            return []
+            return ()
+        except ValueError as e:
+            print(f"Error: Couldn't parse aircraft data: {e}")
+            return ()
 
     def update_loop(self):
         """Background thread to fetch data periodically"""
         while self.running:
             self.status = "SCANNING"
-            self.last_update = time.time()
-            self.aircraft = self.fetch_data()
-            self.status = "ACTIVE" if self.aircraft else "NO CONTACTS"
+            self.last_update = time.monotonic()
+            aircraft = self.fetch_data()
+            self.aircraft = aircraft
+            self.generation += 1
+            self.status = "ACTIVE" if aircraft else "NO CONTACTS"
             time.sleep(config.FETCH_INTERVAL)
 
     def start(self):
@@ -4,11 +4,18 @@ from dataclasses import dataclass
 from typing import Optional
 
 import config
-from utils import calculate_distance_bearing
+from utils import _NM_PER_DEGREE, calculate_distance_bearing
+
+# Both derived from config only, so build them once rather than per aircraft
+_MIL_PREFIXES = tuple(prefix.lower() for prefix in config.MIL_PREFIX_LIST)
+_MAX_LAT_DELTA = config.RADIUS_NM / _NM_PER_DEGREE
 
 @dataclass
 class Aircraft:
     """Aircraft data from tar1090"""
+    # A new instance is built for every aircraft on every fetch, so skip the per-instance __dict__
+    __slots__ = ('hex_code', 'callsign', 'lat', 'lon', 'altitude', 'speed', 'track', 'distance', 'bearing', 'is_military')
+
     hex_code: str
     callsign: str
     lat: float
@@ -18,7 +25,7 @@ class Aircraft:
     track: float
     distance: float
     bearing: float
-    is_military: bool = False
+    is_military: bool
 
     @staticmethod
     def from_dict(data: dict) -> Optional[Aircraft]:
@@ -26,12 +33,14 @@ class Aircraft:
         if 'lat' not in data or 'lon' not in data:
             return None
         lat, lon = data['lat'], data['lon']
-        distance, bearing = calculate_distance_bearing(config.LAT, config.LON, lat, lon)
+        # Distance is at least the latitude difference in NM, so anything outside this band can be dropped before any trig
+        if abs(lat - config.LAT) > _MAX_LAT_DELTA:
+            return None
+        distance, bearing = calculate_distance_bearing(lat, lon)
         if distance > config.RADIUS_NM:
             return None
         hex_code = data['hex'].lower()
-        mil_prefixes = tuple(prefix.lower() for prefix in config.MIL_PREFIX_LIST)
-        is_military = hex_code.startswith(mil_prefixes)
+        is_military = hex_code.startswith(_MIL_PREFIXES)
         return Aircraft(
             hex_code=hex_code,
             callsign=data.get('flight', 'UNKNOWN').strip()[:8],
@@ -5,7 +5,6 @@ os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 import pygame
 import sys
 import time
-from datetime import datetime
 from typing import Optional
 
 import config
@@ -36,13 +35,19 @@ def main():
     }
 
     # Display Setup
-    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.SCALED)
+    # SCALED keeps a logical surface and rescales it on every update, so only use it when the desktop differs
+    desktop = pygame.display.Info()
+    if config.USE_SCALED and (desktop.current_w, desktop.current_h) != (config.SCREEN_WIDTH, config.SCREEN_HEIGHT):
+        display_flags = pygame.FULLSCREEN | pygame.SCALED
+    else:
+        display_flags = pygame.FULLSCREEN | pygame.DOUBLEBUF
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), display_flags)
     pygame.display.set_caption(f"{config.AREA_NAME} ADS-B RADAR")
     clock = pygame.time.Clock()
     background = utils.load_background(config.BACKGROUND_PATH) if config.BACKGROUND_PATH else None
     
     # Mouse Visibility Control
-    last_mouse_move = time.time()
+    last_mouse_move = time.monotonic()
     MOUSE_HIDE_DELAY = 3.0
     pygame.mouse.set_visible(True)
 
@@ -50,6 +55,16 @@ def main():
     radar_size = min(config.SCREEN_HEIGHT - 120, config.SCREEN_WIDTH // 2 - 50) // 2
     radar = RadarScope(screen, config.SCREEN_WIDTH // 4, config.SCREEN_HEIGHT // 2 + 35, radar_size)
     table = DataTable(screen, config.SCREEN_WIDTH // 2 + 20, 80, config.SCREEN_WIDTH // 2 - 30, config.SCREEN_HEIGHT - 100)
+
+    # Static Layer: background and everything that never changes, composited once onto an opaque
+    # display-format surface so each frame starts with a plain copy instead of a fill plus redraw
+    static_layer = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT)).convert()
+    static_layer.blit(background, (0, 0)) if background else static_layer.fill(config.BLACK)
+    radar_title = utils.render_text(font_cache['radar'], "◄ ADS-B RADAR SCOPE ►", config.AMBER)
+    radar_title_rect = radar_title.get_rect(centerx=config.SCREEN_WIDTH//4, y=config.SCREEN_HEIGHT//2 - radar_size)
+    static_layer.blit(radar_title, radar_title_rect)
+    radar.draw_static(static_layer)
+    table.draw_static(static_layer)
     
     # Initialise Audio and Data Tracker
     audio = AudioManager(config.ATC_STREAM_URL)
@@ -61,30 +76,45 @@ def main():
     tracker.start()
 
     # Main Loop
+    # Only regions drawn this frame or the last can differ from the static layer, so only those are pushed
+    # to the display. The first frame has nothing to compare against and updates the whole screen.
+    previous_dirty = [screen.get_rect()]
+    header_second = None
+    header_rect = pygame.Rect(0, 0, 0, 0)
     running = True
     while running:
+        # Monotonic time, read once per frame, drives every timer (mouse hide, blink, countdown);
+        # wall time is read separately below and only drives the header clock
+        now = time.monotonic()
+
         # Mouse Cursor Visibility
-        if time.time() - last_mouse_move > MOUSE_HIDE_DELAY:
+        if now - last_mouse_move > MOUSE_HIDE_DELAY:
             pygame.mouse.set_visible(False)
 
         # Drawing
-        screen.blit(background, (0, 0)) if background else screen.fill(config.BLACK)
-
-        # Header
-        current_time = datetime.now().strftime("%H:%M:%S")
-        header_text = f"{config.AREA_NAME} {config.LAT}°, {config.LON}° - {current_time}"
-        header = font_cache['header'].render(header_text, True, config.AMBER)
-        header_rect = header.get_rect(centerx=config.SCREEN_WIDTH // 2, y=15)
+        screen.blit(static_layer, (0, 0))
+        dirty = []
+
+        # Header: the clock text only changes once a second
+        wall_second = int(time.time())
+        if wall_second != header_second:
+            current_time = time.strftime("%H:%M:%S", time.localtime(wall_second))
+            header_text = f"{config.AREA_NAME} {config.LAT}°, {config.LON}° - {current_time}"
+            # A new string every second, so render directly rather than filling the text cache with one-off surfaces
+            header = font_cache['header'].render(header_text, True, config.AMBER).convert_alpha()
+            dirty.append(header_rect)
+            header_rect = header.get_rect(centerx=config.SCREEN_WIDTH // 2, y=15)
+            dirty.append(header_rect)
+            header_second = wall_second
         screen.blit(header, header_rect)
 
-        # Radar Title
-        radar_title = font_cache['radar'].render("◄ ADS-B RADAR SCOPE ►", True, config.AMBER)
-        radar_title_rect = radar_title.get_rect(centerx=config.SCREEN_WIDTH//4, y=config.SCREEN_HEIGHT//2 - radar_size)
-        screen.blit(radar_title, radar_title_rect)
-
         # Components
-        radar.draw(tracker.aircraft)
-        table.draw(tracker.aircraft, tracker.status, tracker.last_update)
+        # Read the generation before the snapshot: the tracker bumps it only after publishing, so a
+        # snapshot read afterwards is never older than the generation the components cache it under
+        generation = tracker.generation
+        aircraft = tracker.aircraft
+        dirty += radar.draw(aircraft, generation, now)
+        dirty += table.draw(aircraft, generation, tracker.status, tracker.last_update, now)
 
         # Instructions with clickable areas (centered under radar scope)
         quit_text = "Q/ESC: QUIT"
@@ -95,19 +125,19 @@ def main():
         if audio_text:
             instruction_text += "    " + audio_text
 
-        instruction_surface = font_cache['instruction'].render(instruction_text, True, config.DIM_GREEN)
+        instruction_surface = utils.render_text(font_cache['instruction'], instruction_text, config.DIM_GREEN)
         # Centre the instructions under the radar scope (same centerx as radar title)
         instruction_rect = instruction_surface.get_rect(centerx=config.SCREEN_WIDTH // 4, y=config.SCREEN_HEIGHT - 55)
 
         # For hover/click, calculate the rects for each part
-        quit_surface = font_cache['instruction'].render(quit_text, True, config.DIM_GREEN)
+        quit_surface = utils.render_text(font_cache['instruction'], quit_text, config.DIM_GREEN)
         quit_rect = quit_surface.get_rect()
         quit_rect.y = config.SCREEN_HEIGHT - 55
         # Place quit_rect at left of combined text
         quit_rect.x = instruction_rect.x
 
         if audio_text:
-            audio_surface = font_cache['instruction'].render(audio_text, True, config.DIM_GREEN)
+            audio_surface = utils.render_text(font_cache['instruction'], audio_text, config.DIM_GREEN)
             audio_rect = audio_surface.get_rect()
             audio_rect.y = config.SCREEN_HEIGHT - 55
             # Place audio_rect after quit_rect with spacing
@@ -127,11 +157,11 @@ def main():
             audio_col = config.BRIGHT_GREEN
 
         # Redraw with highlight if hovered
-        quit_surface = font_cache['instruction'].render(quit_text, True, quit_col)
-        screen.blit(quit_surface, quit_rect)
+        quit_surface = utils.render_text(font_cache['instruction'], quit_text, quit_col)
+        dirty.append(screen.blit(quit_surface, quit_rect))
         if audio_surface and audio_rect:
-            audio_surface = font_cache['instruction'].render(audio_text, True, audio_col)
-            screen.blit(audio_surface, audio_rect)
+            audio_surface = utils.render_text(font_cache['instruction'], audio_text, audio_col)
+            dirty.append(screen.blit(audio_surface, audio_rect))
 
         # Event handling
         for event in pygame.event.get():
@@ -146,14 +176,18 @@ def main():
                     audio.toggle()
                 elif quit_rect.collidepoint(mouse_pos):
                     running = False
-                last_mouse_move = time.time()
+                last_mouse_move = now
                 pygame.mouse.set_visible(True)
             elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
-                last_mouse_move = time.time()
+                last_mouse_move = now
                 pygame.mouse.set_visible(True)
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWSIZECHANGED, pygame.WINDOWRESTORED):
+                # The window contents were lost, so push the whole screen rather than just the dirty areas
+                previous_dirty = [screen.get_rect()]
 
         # Update display
-        pygame.display.flip()
+        pygame.display.update(previous_dirty + dirty)
+        previous_dirty = dirty
         clock.tick(config.FPS)
 
     # Shutdown
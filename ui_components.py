@@ -1,12 +1,48 @@
+import functools
+import heapq
+import operator
 import pygame
-import time
 import math
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import config
 from data_models import Aircraft
 import utils
 
+# Track is reported to about a degree, so trail directions come from a lookup table
+_TRACK_SIN = [math.sin(math.radians(d)) for d in range(360)]
+_TRACK_COS = [math.cos(math.radians(d)) for d in range(360)]
+
+_BY_DISTANCE = operator.attrgetter('distance')
+
+def _make_projector(center_x: int, center_y: int, radius: int) -> Callable[[float, float], Optional[Tuple[int, int]]]:
+    """Build a lat/lon to screen projection with the location, range and scope geometry folded into local constants"""
+    range_km = config.RADIUS_NM * 1.852
+    k_lon = 111 * math.cos(math.radians(config.LAT)) / range_km * radius
+    k_lat = 111 / range_km * radius
+    lat0, lon0 = config.LAT, config.LON
+    radius_sq = radius * radius
+
+    def lat_lon_to_screen(lat: float, lon: float) -> Optional[Tuple[int, int]]:
+        """Convert lat/lon to screen coordinates, or None if outside the scope"""
+        dx = (lon - lon0) * k_lon
+        dy = (lat0 - lat) * k_lat
+        if dx*dx + dy*dy <= radius_sq:
+            return int(center_x + dx), int(center_y + dy)
+        return None
+    return lat_lon_to_screen
+
+@functools.lru_cache(maxsize=512)
+def _trail_sprite(colour: tuple, dx: int, dy: int) -> Tuple[pygame.Surface, int, int]:
+    """Render a trail line from (dx, dy) to the origin, returning the sprite and the origin's offset within it.
+
+    Pre-rendering lets trails join the same blit sequence as dots and callsigns, keeping per-aircraft draw order.
+    """
+    ox, oy = max(-dx, 0) + 2, max(-dy, 0) + 2
+    surface = pygame.Surface((abs(dx) + 5, abs(dy) + 5), pygame.SRCALPHA)
+    pygame.draw.line(surface, colour, (ox + dx, oy + dy), (ox, oy), 2)
+    return surface.convert_alpha(), ox, oy
+
 class RadarScope:
     """Radar display component"""
     def __init__(self, screen: pygame.Surface, center_x: int, center_y: int, radius: int):
@@ -15,116 +51,198 @@ class RadarScope:
         self.center_y = center_y
         self.radius = radius
         self.font = utils.load_font(config.RADAR_FONT_SIZE)
+        self.lat_lon_to_screen = _make_projector(center_x, center_y, radius)
+        # Screen positions only change when the tracker publishes a new snapshot, so project once per generation
+        self._projected_generation = -1
+        self._plots: List[Tuple[Aircraft, int, int]] = []
+        # Aircraft dots are pre-rendered sprites, so drawing one is a blit rather than a rasterised circle
+        self.dot_surfaces = {colour: self._render_dot(colour) for colour in (config.RED, config.BRIGHT_GREEN)}
+        # Ring labels depend only on RADIUS_NM and the scope size
+        self.range_labels = [(utils.render_text(self.font, f"{int((ring / 3) * config.RADIUS_NM)}NM", config.DIM_GREEN),
+                              (self.center_x + int((ring / 3) * self.radius) - 20, self.center_y + 5))
+                             for ring in range(1, 4)]
 
-    def lat_lon_to_screen(self, lat: float, lon: float) -> Optional[Tuple[int, int]]:
-        """Convert lat/lon to screen coordinates"""
-        lat_km = (lat - config.LAT) * 111
-        lon_km = (lon - config.LON) * 111 * math.cos(math.radians(config.LAT))
-        range_km = config.RADIUS_NM * 1.852
-        x = self.center_x + (lon_km / range_km) * self.radius
-        y = self.center_y - (lat_km / range_km) * self.radius
-
-        dx, dy = x - self.center_x, y - self.center_y
-        if dx*dx + dy*dy <= self.radius*self.radius:
-            return int(x), int(y)
-        return None
+    @staticmethod
+    def _render_dot(colour: tuple) -> pygame.Surface:
+        """Render the aircraft dot for a colour"""
+        surface = pygame.Surface((11, 11), pygame.SRCALPHA)
+        pygame.draw.circle(surface, colour, (5, 5), 5, 0)
+        return surface.convert_alpha()
 
-    def draw_aircraft(self, aircraft: Aircraft, x: int, y: int, colour: tuple):
-        """Draw aircraft symbol with direction indicator"""
-        pygame.draw.circle(self.screen, colour, (x, y), 5, 0)
+    def project_aircraft(self, aircraft_list: Sequence[Aircraft]) -> List[Tuple[Aircraft, int, int]]:
+        """Project a whole aircraft list to screen positions, dropping anything outside the scope"""
+        plots = []
+        project = self.lat_lon_to_screen
+        for aircraft in aircraft_list:
+            pos = project(aircraft.lat, aircraft.lon)
+            if pos:
+                plots.append((aircraft, *pos))
+        return plots
+
+    def draw_aircraft(self, aircraft: Aircraft, x: int, y: int, colour: tuple, blit_sequence: list):
+        """Queue the aircraft symbol, direction indicator and callsign onto blit_sequence"""
+        blit_sequence.append((self.dot_surfaces[colour], (x - 5, y - 5)))
         if aircraft.track > 0:
-            track_rad = math.radians(aircraft.track)
+            track = round(aircraft.track) % 360
             min_length, max_length, max_speed = config.TRAIL_MIN_LENGTH, config.TRAIL_MAX_LENGTH, config.TRAIL_MAX_SPEED
             trail_length = min_length + (max_length - min_length) * min(aircraft.speed, max_speed) / max_speed
-            trail_x = x - trail_length * math.sin(track_rad)
-            trail_y = y + trail_length * math.cos(track_rad)
-            pygame.draw.line(self.screen, colour, (int(trail_x), int(trail_y)), (x, y), 2)
+            trail_x = x - trail_length * _TRACK_SIN[track]
+            trail_y = y + trail_length * _TRACK_COS[track]
+            trail, ox, oy = _trail_sprite(colour, int(trail_x) - x, int(trail_y) - y)
+            blit_sequence.append((trail, (x - ox, y - oy)))
         
-        text = self.font.render(aircraft.callsign, True, colour)
-        self.screen.blit(text, (x + 8, y - 12))
+        text = utils.render_text(self.font, aircraft.callsign, colour)
+        blit_sequence.append((text, (x + 8, y - 12)))
 
-    def draw(self, aircraft_list: List[Aircraft]):
-        """Draw the complete radar scope"""
+    def draw_static(self, surface: pygame.Surface):
+        """Draw the range rings, labels and crosshairs onto the static layer"""
         for ring in range(1, 4):
             ring_radius = int((ring / 3) * self.radius)
-            pygame.draw.circle(self.screen, config.DIM_GREEN, (self.center_x, self.center_y), ring_radius, 2)
-            range_nm = int((ring / 3) * config.RADIUS_NM)
-            text = self.font.render(f"{range_nm}NM", True, config.DIM_GREEN)
-            self.screen.blit(text, (self.center_x + ring_radius - 20, self.center_y + 5))
+            pygame.draw.circle(surface, config.DIM_GREEN, (self.center_x, self.center_y), ring_radius, 2)
+        surface.blits(self.range_labels)
 
-        pygame.draw.line(self.screen, config.DIM_GREEN, (self.center_x - self.radius, self.center_y), (self.center_x + self.radius, self.center_y), 2)
-        pygame.draw.line(self.screen, config.DIM_GREEN, (self.center_x, self.center_y - self.radius), (self.center_x, self.center_y + self.radius), 2)
-        pygame.draw.circle(self.screen, config.BRIGHT_GREEN, (self.center_x, self.center_y), self.radius, 3)
+        pygame.draw.line(surface, config.DIM_GREEN, (self.center_x - self.radius, self.center_y), (self.center_x + self.radius, self.center_y), 2)
+        pygame.draw.line(surface, config.DIM_GREEN, (self.center_x, self.center_y - self.radius), (self.center_x, self.center_y + self.radius), 2)
+        pygame.draw.circle(surface, config.BRIGHT_GREEN, (self.center_x, self.center_y), self.radius, 3)
 
-        blink_state = int(time.time() * 2) % 2
-        for aircraft in aircraft_list:
-            pos = self.lat_lon_to_screen(aircraft.lat, aircraft.lon)
-            if pos:
-                x, y = pos
-                if aircraft.is_military:
-                    if not config.BLINK_MILITARY or blink_state:
-                        self.draw_aircraft(aircraft, x, y, config.RED)
-                else:
-                    self.draw_aircraft(aircraft, x, y, config.BRIGHT_GREEN)
+    def draw(self, aircraft_list: Sequence[Aircraft], generation: int, now: float) -> List[pygame.Rect]:
+        """Draw the aircraft on the radar scope, returning the areas drawn"""
+        if generation != self._projected_generation:
+            self._plots = self.project_aircraft(aircraft_list)
+            self._projected_generation = generation
+
+        blit_sequence = []
+        blink_state = int(now * 2) % 2
+        for aircraft, x, y in self._plots:
+            if aircraft.is_military:
+                if not config.BLINK_MILITARY or blink_state:
+                    self.draw_aircraft(aircraft, x, y, config.RED, blit_sequence)
+            else:
+                self.draw_aircraft(aircraft, x, y, config.BRIGHT_GREEN, blit_sequence)
+        # One call for every dot, trail and callsign, in the same per-aircraft order as drawing them individually
+        return self.screen.blits(blit_sequence)
 
 class DataTable:
     """Aircraft data table component"""
+    STATUSES = ("INITIALISING", "SCANNING", "ACTIVE", "NO CONTACTS")
+
     def __init__(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
         self.screen = screen
         self.rect = pygame.Rect(x, y, width, height)
         self.font = utils.load_font(config.TABLE_FONT_SIZE)
 
-    def draw(self, aircraft_list: List[Aircraft], status: str, last_update: float):
-        """Draw aircraft data table"""
-        pygame.draw.rect(self.screen, config.BRIGHT_GREEN, self.rect, 3)
-        title = self.font.render("AIRCRAFT DATA", True, config.AMBER)
-        title_rect = title.get_rect(centerx=self.rect.centerx, y=self.rect.y + 10)
-        self.screen.blit(title, title_rect)
-
-        headers_y = self.rect.y + 40
+        # Column layout and every string that can't change at runtime, rendered once
+        self.headers_y = self.rect.y + 40
         headers = ["CALLSIGN", "   ALT", "SPD", "DIST", "TRK"]
         total_width = self.rect.width - 40
         col_widths = [0.25, 0.25, 0.15, 0.2, 0.15]
-        col_positions = []
+        self.col_positions = []
         current_x = self.rect.x + 20
-        for i, width_ratio in enumerate(col_widths):
-            width = int(total_width * width_ratio)
-            col_positions.append(current_x)
-            text = self.font.render(headers[i], True, config.AMBER)
-            self.screen.blit(text, (current_x, headers_y))
-            current_x += width
-
-        pygame.draw.line(self.screen, config.DIM_GREEN, (self.rect.x + 8, headers_y + config.TABLE_FONT_SIZE), (self.rect.right - 8, headers_y + config.TABLE_FONT_SIZE), 2)
-
-        sorted_aircraft = sorted(aircraft_list, key=lambda a: a.distance)
-        start_y = headers_y + 30
-        for i, aircraft in enumerate(sorted_aircraft[:config.MAX_TABLE_ROWS]):
+        for width_ratio in col_widths:
+            self.col_positions.append(current_x)
+            current_x += int(total_width * width_ratio)
+
+        self.title = utils.render_text(self.font, "AIRCRAFT DATA", config.AMBER)
+        self.title_rect = self.title.get_rect(centerx=self.rect.centerx, y=self.rect.y + 10)
+        self.header_surfaces = [utils.render_text(self.font, header, config.AMBER) for header in headers]
+        self.status_surfaces = {s: utils.render_text(self.font, f"STATUS: {s}", config.BRIGHT_GREEN) for s in self.STATUSES}
+        self.range_surface = utils.render_text(self.font, f"RANGE: {config.RADIUS_NM}NM", config.BRIGHT_GREEN)
+        self.interval_surface = utils.render_text(self.font, f"INTERVAL: {config.FETCH_INTERVAL}S", config.BRIGHT_GREEN)
+        self.status_y = self.rect.bottom - 5 * config.TABLE_FONT_SIZE - 10
+
+        self.countdown_surfaces = [utils.render_text(self.font, f"NEXT UPDATE: {i:02d}S", config.BRIGHT_GREEN)
+                                   for i in range(config.FETCH_INTERVAL + 1)]
+        self.updating_surface = utils.render_text(self.font, "NEXT UPDATE: UPDATING", config.YELLOW)
+
+        # Rows and the military count only change when the tracker publishes a new snapshot
+        self._selected_generation = -1
+        self._military_count = 0
+        # Per row: (colour and cell text, blits); per aircraft: the last cell text and its rendered surfaces
+        self._rows: List[Tuple[tuple, list]] = []
+        self._row_blits: list = []
+        self._row_cache: Dict[str, Tuple[tuple, List[pygame.Surface]]] = {}
+
+    def draw_static(self, surface: pygame.Surface):
+        """Draw the table frame, headers and fixed status lines onto the static layer"""
+        pygame.draw.rect(surface, config.BRIGHT_GREEN, self.rect, 3)
+        surface.blit(self.title, self.title_rect)
+
+        headers_y = self.headers_y
+        for x, text in zip(self.col_positions, self.header_surfaces):
+            surface.blit(text, (x, headers_y))
+
+        pygame.draw.line(surface, config.DIM_GREEN, (self.rect.x + 8, headers_y + config.TABLE_FONT_SIZE), (self.rect.right - 8, headers_y + config.TABLE_FONT_SIZE), 2)
+
+        surface.blit(self.range_surface, (self.rect.x + 20, self.status_y + 2 * config.TABLE_FONT_SIZE))
+        surface.blit(self.interval_surface, (self.rect.x + 20, self.status_y + 3 * config.TABLE_FONT_SIZE))
+
+    def update_rows(self, closest: Sequence[Aircraft]) -> List[pygame.Rect]:
+        """Lay out the table rows for a new selection, returning the areas of rows that changed.
+
+        Surfaces are reused for any aircraft whose cells read the same as when they were last rendered.
+        """
+        row_cache = {}
+        rows = []
+        start_y = self.headers_y + 30
+        for i, aircraft in enumerate(closest):
             y_pos = start_y + i * config.TABLE_FONT_SIZE
             colour = config.RED if aircraft.is_military else config.BRIGHT_GREEN
-            columns = [
+            columns = (
                 f"{aircraft.callsign:<8}",
                 f"{aircraft.altitude:>6}" if isinstance(aircraft.altitude, int) and aircraft.altitude > 0 else "   N/A",
                 f"{aircraft.speed:>3}" if aircraft.speed > 0 else "N/A",
                 f"{aircraft.distance:>4.1f}" if aircraft.distance > 0 else "N/A ",
                 f"{aircraft.track:>3.0f}°" if aircraft.track > 0 else "N/A"
-            ]
-            for j, value in enumerate(columns):
-                text = self.font.render(str(value), True, colour)
-                self.screen.blit(text, (col_positions[j], y_pos))
+            )
+            content = (colour, columns)
+            cached = self._row_cache.get(aircraft.hex_code)
+            if cached and cached[0] == content:
+                surfaces = cached[1]
+            else:
+                surfaces = [utils.render_text(self.font, value, colour) for value in columns]
+            row_cache[aircraft.hex_code] = (content, surfaces)
+            rows.append((content, [(text, (x, y_pos)) for text, x in zip(surfaces, self.col_positions)]))
+
+        dirty = []
+        for i in range(max(len(rows), len(self._rows))):
+            old = self._rows[i] if i < len(self._rows) else None
+            new = rows[i] if i < len(rows) else None
+            if old is None or new is None or old[0] != new[0]:
+                for row in (old, new):
+                    if row:
+                        dirty += [text.get_rect(topleft=pos) for text, pos in row[1]]
+
+        self._row_cache = row_cache
+        self._rows = rows
+        self._row_blits = [cell for _, cells in rows for cell in cells]
+        return dirty
+
+    def draw(self, aircraft_list: Sequence[Aircraft], generation: int, status: str, last_update: float, now: float) -> List[pygame.Rect]:
+        """Draw aircraft rows and live status lines, returning the areas that may have changed"""
+        dirty = []
+        if generation != self._selected_generation:
+            # Only the closest MAX_TABLE_ROWS are shown, so select them rather than sorting everything
+            closest = heapq.nsmallest(config.MAX_TABLE_ROWS, aircraft_list, key=_BY_DISTANCE)
+            self._military_count = sum(1 for a in aircraft_list if a.is_military)
+            self._selected_generation = generation
+            dirty += self.update_rows(closest)
+
+        # Unchanged rows still need redrawing over the static layer, but needn't be pushed to the display
+        self.screen.blits(self._row_blits, doreturn=False)
 
-        military_count = sum(1 for a in aircraft_list if a.is_military)
-        elapsed = time.time() - last_update
+        blit_sequence = []
+        elapsed = now - last_update
         countdown = max(0, config.FETCH_INTERVAL - elapsed)
-        countdown_text = f"{int(countdown):02d}S" if countdown > 0 else "UPDATING"
+        status_surface = self.status_surfaces.get(status)
+        if status_surface is None:
+            status_surface = utils.render_text(self.font, f"STATUS: {status}", config.BRIGHT_GREEN)
+        # RANGE and INTERVAL (lines 2 and 3) live on the static layer
         status_info = [
-            f"STATUS: {status}",
-            f"CONTACTS: {len(aircraft_list)} ({military_count} MIL)",
-            f"RANGE: {config.RADIUS_NM}NM",
-            f"INTERVAL: {config.FETCH_INTERVAL}S",
-            f"NEXT UPDATE: {countdown_text}"
+            (0, status_surface),
+            (1, utils.render_text(self.font, f"CONTACTS: {len(aircraft_list)} ({self._military_count} MIL)", config.BRIGHT_GREEN)),
+            (4, self.countdown_surfaces[min(int(countdown), config.FETCH_INTERVAL)] if countdown > 0 else self.updating_surface)
         ]
-        status_y = self.rect.bottom - 5 * config.TABLE_FONT_SIZE - 10
-        for i, info in enumerate(status_info):
-            colour = config.YELLOW if "UPDATING" in info else config.BRIGHT_GREEN
-            text = self.font.render(info, True, colour)
-            self.screen.blit(text, (self.rect.x + 20, status_y + i * config.TABLE_FONT_SIZE))
\ No newline at end of file
+        for line, text in status_info:
+            blit_sequence.append((text, (self.rect.x + 20, self.status_y + line * config.TABLE_FONT_SIZE)))
+        dirty += self.screen.blits(blit_sequence)
+        return dirty
\ No newline at end of file
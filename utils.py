@@ -1,24 +1,66 @@
 import math
 import pygame
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 import config
 
+# numba is optional: when installed the distance maths is compiled to native code, otherwise it runs as plain Python.
+# Compiled functions freeze any globals they read into the on-disk cache, so they take the radar centre as arguments.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 _font_cache = {}
+_text_cache = OrderedDict()
+_TEXT_CACHE_SIZE = 1000
+
+# Nautical miles per degree on the same 6371 km sphere the Haversine uses
+_NM_PER_DEGREE = math.radians(6371 * 0.539957)
+
+# Radar centre and its trig terms for the Haversine path
+_LAT0, _LON0 = config.LAT, config.LON
+_LAT0_RAD, _LON0_RAD = math.radians(_LAT0), math.radians(_LON0)
+_SIN_LAT0, _COS_LAT0 = math.sin(_LAT0_RAD), math.cos(_LAT0_RAD)
 
-def calculate_distance_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
-    """Calculate distance in nautical miles and bearing in degrees"""
-    lat1_rad, lon1_rad = math.radians(lat1), math.radians(lon1)
-    lat2_rad, lon2_rad = math.radians(lat2), math.radians(lon2)
-    dlat, dlon = lat2_rad - lat1_rad, lon2_rad - lon1_rad
-    a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+@njit(cache=True, fastmath=True)
+def calculate_distance_bearing_haversine(lat: float, lon: float, lat0_rad: float, lon0_rad: float,
+                                         sin_lat0: float, cos_lat0: float) -> Tuple[float, float]:
+    """Calculate great-circle distance (NM) and bearing (degrees) from a centre whose radians and sin/cos are precomputed"""
+    lat_rad = math.radians(lat)
+    dlat, dlon = lat_rad - lat0_rad, math.radians(lon) - lon0_rad
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+    half_dlat, half_dlon = math.sin(dlat * 0.5), math.sin(dlon * 0.5)
+    a = half_dlat * half_dlat + cos_lat0 * cos_lat * half_dlon * half_dlon
     distance_km = 2 * math.asin(math.sqrt(a)) * 6371
     distance_nm = distance_km * 0.539957
-    y = math.sin(dlon) * math.cos(lat2_rad)
-    x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
+    y = math.sin(dlon) * cos_lat
+    x = cos_lat0 * sin_lat - sin_lat0 * cos_lat * math.cos(dlon)
     bearing = (math.degrees(math.atan2(y, x)) + 360) % 360
     return distance_nm, bearing
 
+@njit(cache=True, fastmath=True)
+def calculate_distance_bearing_fast(lat: float, lon: float, lat0: float, lon0: float) -> Tuple[float, float]:
+    """Calculate distance (NM) and bearing (degrees) from (lat0, lon0) using an equirectangular approximation.
+
+    Degrees are converted with the same Earth radius as the Haversine (about 60.04 NM per degree of latitude).
+    Longitude is scaled at the midpoint latitude, which keeps the error within the radar range to a few
+    thousandths of a NM, well under the table's 0.1 NM resolution.
+    """
+    dx = (lon - lon0) * math.cos(math.radians((lat + lat0) * 0.5))
+    dy = lat - lat0
+    distance_nm = math.hypot(dx, dy) * _NM_PER_DEGREE
+    bearing = (math.degrees(math.atan2(dx, dy)) + 360) % 360
+    return distance_nm, bearing
+
+def calculate_distance_bearing(lat: float, lon: float) -> Tuple[float, float]:
+    """Calculate distance (NM) and bearing (degrees) from the radar centre"""
+    if config.USE_HAVERSINE:
+        return calculate_distance_bearing_haversine(lat, lon, _LAT0_RAD, _LON0_RAD, _SIN_LAT0, _COS_LAT0)
+    return calculate_distance_bearing_fast(lat, lon, _LAT0, _LON0)
+
 def check_pygame_modules():
     """Verify essential Pygame modules are available"""
     print("\nChecking Pygame module support...")
@@ -36,7 +78,7 @@ def load_background(path: str) -> Optional[pygame.Surface]:
         if bg.get_size() != (config.SCREEN_WIDTH, config.SCREEN_HEIGHT):
             print(f"Warning: Resizing background from {bg.get_size()} to display resolution")
             bg = pygame.transform.scale(bg, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-        return bg
+        return bg.convert()
     except (pygame.error, FileNotFoundError) as e:
         print(f"Warning: Couldn't load background image: {e}")
         return None
@@ -55,3 +97,20 @@ def load_font(size: int) -> pygame.font.Font:
     
     _font_cache[size] = font
     return font
+
+def render_text(font: pygame.font.Font, text: str, colour: tuple) -> pygame.Surface:
+    """Render antialiased text, reusing surfaces from a bounded LRU cache."""
+    key = (font, text, colour)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = font.render(text, True, colour)
+    if pygame.display.get_surface():
+        # Match the display pixel format once so every later blit skips per-pixel conversion
+        surface = surface.convert_alpha()
+    _text_cache[key] = surface
+    if len(_text_cache) > _TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface